@@ -75,6 +75,12 @@ protected:
     //! #m_falloff_low_rates and #m_falloff_high_rates)
     std::map<size_t, size_t> m_rfallindx;
 
+    //! True for "falloff" reactions and false for "chemically-activated"
+    //! reactions, by falloff reaction index. Set when the reaction is added
+    //! so that rate evaluation does not have to re-query the reaction type
+    //! string for every falloff reaction on every update.
+    std::vector<bool> m_isFalloff;
+
     //! Rate expressions for falloff reactions at the low-pressure limit
     Rate1<Arrhenius> m_falloff_low_rates;
 
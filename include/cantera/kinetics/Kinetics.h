@@ -563,6 +563,55 @@ public:
      */
     virtual double productStoichCoeff(size_t k, size_t i) const;
 
+    /**
+     * Get the dense matrix of reactant stoichiometric coefficients for all
+     * reactions in one call. Element *[k*nReactions() + i]* of the output
+     * array is the stoichiometric coefficient of species k as a reactant in
+     * reaction i.
+     *
+     * @param[out] nu  Output array of coefficients.
+     *     Length: nTotalSpecies() * nReactions().
+     */
+    void getReactantStoichCoeffs(double* nu) const;
+
+    /**
+     * Get the dense matrix of product stoichiometric coefficients for all
+     * reactions in one call. Element *[k*nReactions() + i]* of the output
+     * array is the stoichiometric coefficient of species k as a product in
+     * reaction i.
+     *
+     * @param[out] nu  Output array of coefficients.
+     *     Length: nTotalSpecies() * nReactions().
+     */
+    void getProductStoichCoeffs(double* nu) const;
+
+    /**
+     * Get the nonzero reactant stoichiometric coefficients in coordinate
+     * (COO) form. Entry m of the output vectors gives the kinetics species
+     * index, the reaction index, and the value of one nonzero coefficient.
+     * Since each reaction involves only a few species, this representation
+     * requires O(nnz) storage rather than O(N^2).
+     *
+     * @param[out] kSpec   kinetics species index of each nonzero coefficient
+     * @param[out] iRxn    reaction index of each nonzero coefficient
+     * @param[out] coeffs  value of each nonzero coefficient
+     */
+    void getReactantStoichCoeffsSparse(std::vector<size_t>& kSpec,
+                                       std::vector<size_t>& iRxn,
+                                       std::vector<double>& coeffs) const;
+
+    /**
+     * Get the nonzero product stoichiometric coefficients in coordinate
+     * (COO) form. @see getReactantStoichCoeffsSparse
+     *
+     * @param[out] kSpec   kinetics species index of each nonzero coefficient
+     * @param[out] iRxn    reaction index of each nonzero coefficient
+     * @param[out] coeffs  value of each nonzero coefficient
+     */
+    void getProductStoichCoeffsSparse(std::vector<size_t>& kSpec,
+                                      std::vector<size_t>& iRxn,
+                                      std::vector<double>& coeffs) const;
+
     //! Reactant order of species k in reaction i.
     /*!
      * This is the nominal order of the activity concentration in
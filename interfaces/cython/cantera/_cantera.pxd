@@ -527,6 +527,10 @@ cdef extern from "cantera/kinetics/Kinetics.h" namespace "Cantera":
         string productString(int) except +translate_exception
         double reactantStoichCoeff(int, int) except +translate_exception
         double productStoichCoeff(int, int) except +translate_exception
+        void getReactantStoichCoeffs(double*) except +translate_exception
+        void getProductStoichCoeffs(double*) except +translate_exception
+        void getReactantStoichCoeffsSparse(vector[size_t]&, vector[size_t]&, vector[double]&) except +translate_exception
+        void getProductStoichCoeffsSparse(vector[size_t]&, vector[size_t]&, vector[double]&) except +translate_exception
 
         double multiplier(int)
         void setMultiplier(int, double)
@@ -1086,6 +1090,13 @@ cdef class _SolutionBase:
     cdef int thermo_basis
     cdef np.ndarray _selected_species
     cdef object parent
+    # Holder for cached kinetics properties (reaction/species counts, name
+    # lookups). The dict itself is shared between wrappers created by
+    # slicing, so invalidating it reaches every wrapper of the same C++
+    # Kinetics object. It lives here because adding fields to Kinetics would
+    # cause layout conflicts in derived classes with multiple bases (see
+    # note in kinetics.pyx).
+    cdef dict _kinetics_cache
 
 cdef class Species:
     cdef shared_ptr[CxxSpecies] _species
@@ -1311,6 +1322,7 @@ cdef string stringify(x) except *
 cdef pystr(string x)
 cdef np.ndarray get_species_array(Kinetics kin, kineticsMethod1d method)
 cdef np.ndarray get_reaction_array(Kinetics kin, kineticsMethod1d method)
+cdef void fill_species_array(Kinetics kin, kineticsMethod1d method, sl, out) except *
 cdef np.ndarray get_transport_1d(Transport tran, transportMethod1d method)
 cdef np.ndarray get_transport_2d(Transport tran, transportMethod2d method)
 cdef CxxIdealGasPhase* getIdealGasPhase(ThermoPhase phase) except *
@@ -25,6 +25,8 @@ cdef class _SolutionBase:
                           FutureWarning)
             adjacent = kwargs['phases']
 
+        self._kinetics_cache = {}
+
         # Shallow copy of an existing Solution (for slicing support)
         cdef _SolutionBase other
         if origin is not None:
@@ -42,6 +44,9 @@ cdef class _SolutionBase:
 
             self.thermo_basis = other.thermo_basis
             self._selected_species = other._selected_species.copy()
+            # Share the cache holder so that invalidation through any of the
+            # wrappers reaches all wrappers of the same kinetics object
+            self._kinetics_cache = other._kinetics_cache
             return
 
         # Assign base and set managers to NULL
@@ -1,6 +1,11 @@
 # This file is part of Cantera. See License.txt in the top-level directory or
 # at https://cantera.org/license.txt for license and copyright information.
 
+try:
+    from scipy import sparse as _scipy_sparse
+except ImportError:
+    _scipy_sparse = ImportError('Method requires a working scipy installation.')
+
 # NOTE: These cdef functions cannot be members of Kinetics because they would
 # cause "layout conflicts" when creating derived classes with multiple bases,
 # e.g. class Solution. [Cython 0.16]
@@ -18,6 +23,23 @@ cdef np.ndarray get_reaction_array(Kinetics kin, kineticsMethod1d method):
     method(kin.kinetics, &data[0])
     return data
 
+cdef void fill_species_array(Kinetics kin, kineticsMethod1d method, sl, out) except *:
+    # Evaluate a species-length kinetics property into a persistent scratch
+    # buffer (created on first use and dropped whenever the species caches
+    # are invalidated) and copy the slice sl into the caller-supplied array.
+    cdef np.ndarray[np.double_t, ndim=1] buf
+    if len(out) != sl.stop - sl.start:
+        raise ValueError("Output array has incorrect length. "
+                         "Got {0}. Expected {1}.".format(
+                             len(out), sl.stop - sl.start))
+    scratch = kin._kinetics_cache.get('species_rates_scratch')
+    if scratch is None:
+        scratch = np.empty(kin.n_total_species)
+        kin._kinetics_cache['species_rates_scratch'] = scratch
+    buf = scratch
+    method(kin.kinetics, &buf[0])
+    out[:] = buf[sl]
+
 
 cdef class Kinetics(_SolutionBase):
     """
@@ -39,12 +61,20 @@ cdef class Kinetics(_SolutionBase):
         mechanism.
         """
         def __get__(self):
-            return self.kinetics.nTotalSpecies()
+            n = self._kinetics_cache.get('n_total_species')
+            if n is None:
+                n = self.kinetics.nTotalSpecies()
+                self._kinetics_cache['n_total_species'] = n
+            return n
 
     property n_reactions:
         """Number of reactions in the reaction mechanism."""
         def __get__(self):
-            return self.kinetics.nReactions()
+            n = self._kinetics_cache.get('n_reactions')
+            if n is None:
+                n = self.kinetics.nReactions()
+                self._kinetics_cache['n_reactions'] = n
+            return n
 
     property n_phases:
         """Number of phases in the reaction mechanism."""
@@ -76,7 +106,16 @@ cdef class Kinetics(_SolutionBase):
         """
         cdef int k
         if isinstance(species, (str, bytes)):
-            return self.kinetics.kineticsSpeciesIndex(stringify(species))
+            cache = self._kinetics_cache.setdefault('species_indices', {})
+            try:
+                return cache[species]
+            except KeyError:
+                k = self.kinetics.kineticsSpeciesIndex(stringify(species))
+                if k >= 0:
+                    # negative results are not cached, so that species or
+                    # aliases added later are still found
+                    cache[species] = k
+                return k
         else:
             k = species
             self._check_kinetics_species_index(k)
@@ -96,8 +135,12 @@ cdef class Kinetics(_SolutionBase):
         methods of class `Kinetics`.
         """
         def __get__(self):
-            return [self.kinetics_species_name(k)
-                    for k in range(self.n_total_species)]
+            names = self._kinetics_cache.get('species_names')
+            if names is None:
+                names = [pystr(self.kinetics.kineticsSpeciesName(k))
+                         for k in range(self.kinetics.nTotalSpecies())]
+                self._kinetics_cache['species_names'] = names
+            return list(names)
 
     def reaction(self, int i_reaction):
         """
@@ -129,6 +172,10 @@ cdef class Kinetics(_SolutionBase):
     def add_reaction(self, Reaction rxn):
         """ Add a new reaction to this phase. """
         self.kinetics.addReaction(rxn._reaction)
+        # addReaction resizes the kinetics object to pick up any species added
+        # to the member phases since the last resize, so the cached species
+        # counts and lookups may be stale too, not just the reaction count.
+        self._kinetics_cache.clear()
 
     def is_reversible(self, int i_reaction):
         """True if reaction `i_reaction` is reversible."""
@@ -144,15 +191,20 @@ cdef class Kinetics(_SolutionBase):
         self._check_reaction_index(i_reaction)
         return self.kinetics.multiplier(i_reaction)
 
-    def set_multiplier(self, double value, int i_reaction=-1):
+    def set_multiplier(self, value, int i_reaction=-1):
         """
-        Set the multiplier for for reaction *i_reaction* to *value*.
+        Set the multiplier for reaction *i_reaction* to *value*.
         If *i_reaction* is not specified, then the multiplier for all reactions
-        is set to *value*. See `multiplier`.
+        is set to *value*, which may be either a single value or an array of
+        length `n_reactions`. See `multiplier`.
         """
+        cdef np.ndarray[np.double_t, ndim=1] values
+        cdef int i
         if i_reaction == -1:
-            for i_reaction in range(self.n_reactions):
-                self.kinetics.setMultiplier(i_reaction, value)
+            values = np.empty(self.n_reactions)
+            values[:] = value
+            for i in range(values.shape[0]):
+                self.kinetics.setMultiplier(i, values[i])
         else:
             self._check_reaction_index(i_reaction)
             self.kinetics.setMultiplier(i_reaction, value)
@@ -204,7 +256,8 @@ cdef class Kinetics(_SolutionBase):
         See also `reaction_equation`.
         """
         if indices is None:
-            return [self.reaction_equation(i) for i in range(self.n_reactions)]
+            return [pystr(self.kinetics.reactionString(i))
+                    for i in range(self.n_reactions)]
         else:
             return [self.reaction_equation(i) for i in indices]
 
@@ -246,10 +299,7 @@ cdef class Kinetics(_SolutionBase):
         """
         cdef np.ndarray[np.double_t, ndim=2] data = np.empty((self.n_total_species,
                                                               self.n_reactions))
-        cdef int i,k
-        for i in range(self.n_reactions):
-            for k in range(self.n_total_species):
-                data[k,i] = self.kinetics.reactantStoichCoeff(k,i)
+        self.kinetics.getReactantStoichCoeffs(&data[0,0])
         return data
 
     def product_stoich_coeffs(self):
@@ -260,12 +310,45 @@ cdef class Kinetics(_SolutionBase):
         """
         cdef np.ndarray[np.double_t, ndim=2] data = np.empty((self.n_total_species,
                                                               self.n_reactions))
-        cdef int i,k
-        for i in range(self.n_reactions):
-            for k in range(self.n_total_species):
-                data[k,i] = self.kinetics.productStoichCoeff(k,i)
+        self.kinetics.getProductStoichCoeffs(&data[0,0])
         return data
 
+    def reactant_stoich_coeffs_sparse(self):
+        """
+        The reactant stoichiometric coefficients as a ``scipy.sparse``
+        coordinate matrix of shape ``(n_total_species, n_reactions)``. Since
+        each reaction typically involves only a few species, this requires
+        storage proportional to the number of nonzero coefficients rather
+        than the full dense matrix returned by `reactant_stoich_coeffs`. The
+        method requires a working scipy installation.
+        """
+        if isinstance(_scipy_sparse, ImportError):
+            raise _scipy_sparse
+        cdef vector[size_t] k_spec
+        cdef vector[size_t] i_rxn
+        cdef vector[double] coeffs
+        self.kinetics.getReactantStoichCoeffsSparse(k_spec, i_rxn, coeffs)
+        return _scipy_sparse.coo_matrix(
+            (coeffs, (k_spec, i_rxn)),
+            shape=(self.n_total_species, self.n_reactions))
+
+    def product_stoich_coeffs_sparse(self):
+        """
+        The product stoichiometric coefficients as a ``scipy.sparse``
+        coordinate matrix of shape ``(n_total_species, n_reactions)``. See
+        `reactant_stoich_coeffs_sparse`. The method requires a working scipy
+        installation.
+        """
+        if isinstance(_scipy_sparse, ImportError):
+            raise _scipy_sparse
+        cdef vector[size_t] k_spec
+        cdef vector[size_t] i_rxn
+        cdef vector[double] coeffs
+        self.kinetics.getProductStoichCoeffsSparse(k_spec, i_rxn, coeffs)
+        return _scipy_sparse.coo_matrix(
+            (coeffs, (k_spec, i_rxn)),
+            shape=(self.n_total_species, self.n_reactions))
+
     property forward_rates_of_progress:
         """
         Forward rates of progress for the reactions. [kmol/m^3/s] for bulk
@@ -339,6 +422,28 @@ cdef class Kinetics(_SolutionBase):
         def __get__(self):
             return get_species_array(self, kin_getNetProductionRates)
 
+    def net_production_rates_into(self, np.ndarray[np.double_t, ndim=1, mode="c"] out not None):
+        """
+        Write the net production rates for each species [kmol/m^3/s for bulk
+        phases or kmol/m^2/s for surface phases] into the preallocated array
+        *out* and return it. Unlike the `net_production_rates` property, no
+        new array is allocated, so callers evaluating the rates repeatedly
+        (for example in the right-hand side of an ODE integrator) can
+        allocate the output once and reuse it on every step. *out* must be a
+        C-contiguous array of length `n_total_species`.
+
+        In the C++ layer the multiplication by the net stoichiometric
+        coefficients is already fused with the rate-of-progress evaluation,
+        so this writes the species rates with no intermediate species-length
+        buffer at all.
+        """
+        if out.shape[0] != self.n_total_species:
+            raise ValueError("Output array has incorrect length. "
+                             "Got {0}. Expected {1}.".format(
+                                 out.shape[0], self.n_total_species))
+        kin_getNetProductionRates(self.kinetics, &out[0])
+        return out
+
     property delta_enthalpy:
         """Change in enthalpy for each reaction [J/kmol]."""
         def __get__(self):
@@ -383,8 +488,8 @@ cdef class Kinetics(_SolutionBase):
         Get the total volumetric heat release rate [W/m^3].
         """
         def __get__(self):
-            return - np.sum(self.partial_molar_enthalpies *
-                            self.net_production_rates, 0)
+            return - np.dot(self.partial_molar_enthalpies,
+                            self.net_production_rates)
 
     property heat_production_rates:
         """
@@ -440,39 +545,63 @@ cdef class InterfaceKinetics(Kinetics):
         return self._phase_indices[phase]
 
     def _phase_slice(self, phase):
-        p = self.phase_index(phase)
-        k1 = self.kinetics_species_index(0, p)
-
-        if p == self.n_phases - 1:
-            k2 = self.n_total_species
-        else:
-            k2 = self.kinetics_species_index(0, p+1)
-
-        return slice(k1,k2)
-
-    def get_creation_rates(self, phase):
+        # The slices live in the kinetics cache so that they are rebuilt after
+        # anything that can shift the species offsets, such as a species added
+        # to one of the member phases.
+        slices = self._kinetics_cache.get('phase_slices')
+        if slices is None:
+            slices = {}
+            for n in range(self.n_phases):
+                k1 = self.kinetics_species_index(0, n)
+                if n == self.n_phases - 1:
+                    k2 = self.n_total_species
+                else:
+                    k2 = self.kinetics_species_index(0, n+1)
+                slices[n] = slice(k1, k2)
+            self._kinetics_cache['phase_slices'] = slices
+        return slices[self.phase_index(phase)]
+
+    def get_creation_rates(self, phase, out=None):
         """
         Creation rates for each species in phase *phase*. Use the
         `creation_rates` property to get the creation rates for species in all
-        phases.
+        phases. If *out* is supplied, the rates are written into it instead of
+        a newly allocated array; the species rates are evaluated into a
+        scratch buffer that is allocated once and reused, so callers that
+        query the same phase repeatedly (for example from the right-hand side
+        of an ODE integrator) trigger no per-call allocations.
         """
-        return self.creation_rates[self._phase_slice(phase)]
+        if out is None:
+            return self.creation_rates[self._phase_slice(phase)]
+        fill_species_array(self, kin_getCreationRates,
+                           self._phase_slice(phase), out)
+        return out
 
-    def get_destruction_rates(self, phase):
+    def get_destruction_rates(self, phase, out=None):
         """
         Destruction rates for each species in phase *phase*. Use the
         `destruction_rates` property to get the destruction rates for species
-        in all phases.
+        in all phases. If *out* is supplied, the rates are written into it
+        without per-call allocations. See `get_creation_rates`.
         """
-        return self.destruction_rates[self._phase_slice(phase)]
+        if out is None:
+            return self.destruction_rates[self._phase_slice(phase)]
+        fill_species_array(self, kin_getDestructionRates,
+                           self._phase_slice(phase), out)
+        return out
 
-    def get_net_production_rates(self, phase):
+    def get_net_production_rates(self, phase, out=None):
         """
         Net production rates for each species in phase *phase*. Use the
         `net_production_rates` property to get the net_production rates for
-        species in all phases.
-        """
-        return self.net_production_rates[self._phase_slice(phase)]
+        species in all phases. If *out* is supplied, the rates are written
+        into it without per-call allocations. See `get_creation_rates`.
+        """
+        if out is None:
+            return self.net_production_rates[self._phase_slice(phase)]
+        fill_species_array(self, kin_getNetProductionRates,
+                           self._phase_slice(phase), out)
+        return out
 
     def write_yaml(self, filename, phases=None, units=None, precision=None,
                    skip_user_defined=None):
@@ -317,7 +317,7 @@ cdef class Reactor(ReactorBase):
         """
         if not self.n_vars:
             raise CanteraError('Reactor empty or network not initialized.')
-        cdef np.ndarray[np.double_t, ndim=1] y = np.zeros(self.n_vars)
+        cdef np.ndarray[np.double_t, ndim=1] y = np.empty(self.n_vars)
         self.reactor.getState(&y[0])
         return y
 
@@ -1186,7 +1186,7 @@ cdef class ReactorNet:
         """
         if not self.n_vars:
             raise CanteraError('ReactorNet empty or not initialized.')
-        cdef np.ndarray[np.double_t, ndim=1] y = np.zeros(self.n_vars)
+        cdef np.ndarray[np.double_t, ndim=1] y = np.empty(self.n_vars)
         self.net.getState(&y[0])
         return y
 
@@ -1196,7 +1196,7 @@ cdef class ReactorNet:
         """
         if not self.n_vars:
             raise CanteraError('ReactorNet empty or not initialized.')
-        cdef np.ndarray[np.double_t, ndim = 1] dky = np.zeros(self.n_vars)
+        cdef np.ndarray[np.double_t, ndim = 1] dky = np.empty(self.n_vars)
         self.net.getDerivative(k, & dky[0])
         return dky
 
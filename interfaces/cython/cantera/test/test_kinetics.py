@@ -5,6 +5,7 @@ from os.path import join as pjoin
 import os
 
 import cantera as ct
+from cantera._cantera import _scipy_sparse
 from . import utilities
 
 
@@ -49,6 +50,13 @@ class TestKinetics(utilities.CanteraTest):
         self.assertArrayNear(0.5 * fwd_rates0, fwd_rates2)
         self.assertArrayNear(0.5 * rev_rates0, rev_rates2)
 
+        factors = np.linspace(0.5, 2.0, self.phase.n_reactions)
+        self.phase.set_multiplier(factors)
+        fwd_rates3 = self.phase.forward_rates_of_progress
+        rev_rates3 = self.phase.reverse_rates_of_progress
+        self.assertArrayNear(factors * fwd_rates0, fwd_rates3)
+        self.assertArrayNear(factors * rev_rates0, rev_rates3)
+
     def test_reaction_type(self):
         self.assertEqual(self.phase.reaction_type_str(0), "three-body")
         self.assertEqual(self.phase.reaction_type_str(2), "elementary")
@@ -113,12 +121,31 @@ class TestKinetics(utilities.CanteraTest):
         check_product('O', 0, 0)
         check_product('O2', 0, 1)
 
+    @utilities.unittest.skipIf(isinstance(_scipy_sparse, ImportError),
+                               "scipy is not installed")
+    def test_stoich_coeffs_sparse(self):
+        nu_r = self.phase.reactant_stoich_coeffs_sparse()
+        nu_p = self.phase.product_stoich_coeffs_sparse()
+        self.assertTrue((nu_r.toarray() ==
+                         self.phase.reactant_stoich_coeffs()).all())
+        self.assertTrue((nu_p.toarray() ==
+                         self.phase.product_stoich_coeffs()).all())
+
     def test_rates_of_progress(self):
         self.assertEqual(len(self.phase.net_rates_of_progress),
                          self.phase.n_reactions)
         self.assertArrayNear(self.phase.forward_rates_of_progress - self.phase.reverse_rates_of_progress,
                              self.phase.net_rates_of_progress)
 
+    def test_net_production_rates_into(self):
+        out = np.empty(self.phase.n_total_species)
+        ret = self.phase.net_production_rates_into(out)
+        self.assertIs(ret, out)
+        self.assertArrayNear(out, self.phase.net_production_rates)
+
+        with self.assertRaisesRegex(ValueError, 'incorrect length'):
+            self.phase.net_production_rates_into(np.empty(3))
+
     def test_heat_release(self):
         hrr = - self.phase.partial_molar_enthalpies.dot(self.phase.net_production_rates)
         self.assertNear(hrr, self.phase.heat_release_rate)
@@ -259,6 +286,48 @@ class KineticsFromReactions(utilities.CanteraTest):
                              gas2.net_production_rates)
 
 
+class TestInterfacePhaseRates(utilities.CanteraTest):
+    def setUp(self):
+        self.gas = ct.Solution('ptcombust.xml', 'gas')
+        self.surf = ct.Interface('ptcombust.xml', 'Pt_surf', [self.gas])
+        self.gas.TPX = 900, ct.one_atm, 'CH4:0.1, O2:0.2, AR:0.7'
+        self.surf.TP = 900, ct.one_atm
+
+    def test_rate_getters_out(self):
+        for getter in (self.surf.get_creation_rates,
+                       self.surf.get_destruction_rates,
+                       self.surf.get_net_production_rates):
+            for phase in (self.gas, self.surf):
+                expected = getter(phase)
+                out = np.empty(phase.n_species)
+                ret = getter(phase, out)
+                self.assertIs(ret, out)
+                self.assertArrayNear(out, expected)
+
+    def test_rate_getters_out_wrong_length(self):
+        out = np.empty(self.gas.n_species + 1)
+        with self.assertRaisesRegex(ValueError, 'incorrect length'):
+            self.surf.get_creation_rates(self.gas, out)
+
+    def test_add_species_then_add_reaction(self):
+        # Species counts cached on the Interface wrapper must not survive the
+        # kinetics resize triggered by add_reaction after a species has been
+        # added to an adjacent phase
+        ref = ct.Solution('gri30.yaml', transport_model=None)
+        self.gas.add_species(ref.species('NO'))
+        r = ct.Reaction.fromYaml(
+            "{equation: H2O2 + 2 PT(S) => 2 OH(S),"
+            " sticking-coefficient: {A: 0.1, b: 0, Ea: 0}}",
+            self.surf)
+        self.surf.add_reaction(r)
+        self.assertEqual(self.surf.n_total_species,
+                         self.gas.n_species + self.surf.n_species)
+        wdot = self.surf.net_production_rates
+        self.assertEqual(len(wdot), self.surf.n_total_species)
+        gas_rates = self.surf.get_net_production_rates(self.gas)
+        self.assertEqual(len(gas_rates), self.gas.n_species)
+
+
 class KineticsRepeatability(utilities.CanteraTest):
     """
     Tests to make sure that lazily evaluated of terms in the rate expression
@@ -580,6 +580,7 @@ cdef class ThermoPhase(_SolutionBase):
         self.thermo.addSpecies(species._species)
         species._phase = self
         self.thermo.initThermo()
+        self._kinetics_cache.clear()
         if self.kinetics:
             self.kinetics.invalidateCache()
 
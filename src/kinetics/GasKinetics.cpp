@@ -155,7 +155,7 @@ void GasKinetics::processFalloffReactions()
     m_falloffn.pr_to_falloff(pr.data(), falloff_work.data());
 
     for (size_t i = 0; i < m_falloff_low_rates.nReactions(); i++) {
-        if (reactionTypeStr(m_fallindx[i]) == "falloff") {
+        if (m_isFalloff[i]) {
             pr[i] *= m_rfn_high[i];
         } else { // CHEMACT_RXN
             pr[i] *= m_rfn_low[i];
@@ -281,6 +281,7 @@ void GasKinetics::addFalloffReaction(FalloffReaction& r)
     // add this reaction number to the list of falloff reactions
     m_fallindx.push_back(nReactions()-1);
     m_rfallindx[nReactions()-1] = nfall;
+    m_isFalloff.push_back(r.type() == "falloff");
 
     // install the enhanced third-body concentration calculator
     map<size_t, double> efficiencies;
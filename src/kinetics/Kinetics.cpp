@@ -337,6 +337,60 @@ double Kinetics::productStoichCoeff(size_t kSpec, size_t irxn) const
                     0.0);
 }
 
+void Kinetics::getReactantStoichCoeffs(double* nu) const
+{
+    size_t nRxn = nReactions();
+    fill(nu, nu + m_kk * nRxn, 0.0);
+    for (size_t i = 0; i < nRxn; i++) {
+        for (const auto& sp : m_reactions[i]->reactants) {
+            nu[kineticsSpeciesIndex(sp.first) * nRxn + i] = sp.second;
+        }
+    }
+}
+
+void Kinetics::getProductStoichCoeffs(double* nu) const
+{
+    size_t nRxn = nReactions();
+    fill(nu, nu + m_kk * nRxn, 0.0);
+    for (size_t i = 0; i < nRxn; i++) {
+        for (const auto& sp : m_reactions[i]->products) {
+            nu[kineticsSpeciesIndex(sp.first) * nRxn + i] = sp.second;
+        }
+    }
+}
+
+void Kinetics::getReactantStoichCoeffsSparse(vector<size_t>& kSpec,
+                                             vector<size_t>& iRxn,
+                                             vector<double>& coeffs) const
+{
+    kSpec.clear();
+    iRxn.clear();
+    coeffs.clear();
+    for (size_t i = 0; i < nReactions(); i++) {
+        for (const auto& sp : m_reactions[i]->reactants) {
+            kSpec.push_back(kineticsSpeciesIndex(sp.first));
+            iRxn.push_back(i);
+            coeffs.push_back(sp.second);
+        }
+    }
+}
+
+void Kinetics::getProductStoichCoeffsSparse(vector<size_t>& kSpec,
+                                            vector<size_t>& iRxn,
+                                            vector<double>& coeffs) const
+{
+    kSpec.clear();
+    iRxn.clear();
+    coeffs.clear();
+    for (size_t i = 0; i < nReactions(); i++) {
+        for (const auto& sp : m_reactions[i]->products) {
+            kSpec.push_back(kineticsSpeciesIndex(sp.first));
+            iRxn.push_back(i);
+            coeffs.push_back(sp.second);
+        }
+    }
+}
+
 int Kinetics::reactionType(size_t i) const {
     warn_deprecated("Kinetics::reactionType()",
         "To be changed after Cantera 2.6. "